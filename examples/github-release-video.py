@@ -25,38 +25,112 @@ Requirements:
 -------------
 pip install vloex requests
 
+For the concurrent multi-repo mode (--all):
+pip install "httpx[http2]"
+
 Get your API key from: https://vloex.com/dashboard/api-keys
 """
 
+import asyncio
 import os
 import sys
 import time
 import json
+import re
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
 import requests
-from vloex import Vloex, VloexError
+from vloex import Vloex, AsyncVloex, VloexError
+
+try:
+    import orjson  # Optional: faster JSON parsing (pip install orjson)
+except ImportError:
+    orjson = None
+
+
+# Shared keep-alive session for GitHub API calls
+github_session = requests.Session()
+github_session.headers['Accept'] = 'application/vnd.github+json'
+
+# ETag cache for conditional GETs (304 responses are cheap on rate limits)
+RELEASE_CACHE_PATH = Path.home() / '.cache' / 'vloex' / 'gh_releases.json'
+
+# In-process cache so retries / fan-out for the same repo skip the network
+RELEASE_TTL_SECONDS = 60
+_release_memo = {}
+
+# Bullet lines ("- item"), optionally indented
+_BULLET_RE = re.compile(r'(?m)^[ \t]*-[ \t]+(\S.*?)[ \t\r]*$')
+
 
+def load_release_cache():
+    """Load the on-disk release cache, or an empty cache if missing/corrupt."""
+    try:
+        return json.loads(RELEASE_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_release_cache(cache):
+    """Persist the release cache; failures are non-fatal."""
+    try:
+        RELEASE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        RELEASE_CACHE_PATH.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError:
+        pass
 
-def fetch_latest_release(repo_owner, repo_name):
+
+def fetch_latest_release(repo_owner, repo_name, force_refresh=False):
     """
     Fetch the latest release from a GitHub repository.
 
+    Uses an ETag cache so unchanged releases come back as a cheap 304, and
+    remembers results in-process for RELEASE_TTL_SECONDS.
+
     Args:
         repo_owner (str): GitHub username or organization (e.g., 'vercel')
         repo_name (str): Repository name (e.g., 'next.js')
+        force_refresh (bool): Bypass the in-process cache
 
     Returns:
         dict: Release data from GitHub API
     """
     url = f'https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest'
 
+    memo_key = (repo_owner, repo_name)
+    memo = _release_memo.get(memo_key)
+    if memo and not force_refresh and time.monotonic() - memo[0] < RELEASE_TTL_SECONDS:
+        return memo[1]
+
     print(f'🔍 Fetching latest release from {repo_owner}/{repo_name}...')
 
-    response = requests.get(url)
+    cache_key = f'{repo_owner}/{repo_name}'
+    cache = load_release_cache()
+    cached = cache.get(cache_key)
+
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+
+    response = github_session.get(url, headers=headers)
+
+    if response.status_code == 304 and cached:
+        _release_memo[memo_key] = (time.monotonic(), cached['body'])
+        return cached['body']
 
     if response.status_code != 200:
         raise Exception(f'GitHub API error: {response.status_code}')
 
-    return response.json()
+    release = orjson.loads(response.content) if orjson else response.json()
+
+    etag = response.headers.get('ETag')
+    if etag:
+        cache[cache_key] = {'etag': etag, 'body': release}
+        save_release_cache(cache)
+
+    _release_memo[memo_key] = (time.monotonic(), release)
+    return release
 
 
 def extract_release_highlights(release_body, max_items=5):
@@ -70,14 +144,8 @@ def extract_release_highlights(release_body, max_items=5):
     Returns:
         list: List of change descriptions
     """
-    # Extract bullet points (lines starting with '- ')
-    changes = [
-        line[2:].strip()  # Remove '- ' prefix
-        for line in release_body.split('\n')
-        if line.strip().startswith('- ')
-    ]
-
-    return changes[:max_items]
+    # Extract bullet points (lines starting with '- '), stopping at max_items
+    return [m.group(1) for m in islice(_BULLET_RE.finditer(release_body), max_items)]
 
 
 def create_release_script(version, changes, repo_name):
@@ -92,32 +160,46 @@ def create_release_script(version, changes, repo_name):
     Returns:
         str: Formatted video script
     """
-    script = f"{repo_name} {version} has been released!\n\n"
+    return _build_script(version, tuple(changes), repo_name)
+
+
+@lru_cache(maxsize=64)
+def _build_script(version, changes, repo_name):
+    # Cached on (version, changes, repo_name) so retries reuse the same string
+    parts = [f"{repo_name} {version} has been released!\n\n"]
 
     if changes:
-        script += "This release includes important updates:\n\n"
-        script += "\n".join(changes)
-        script += "\n\n"
+        parts.append("This release includes important updates:\n\n")
+        parts.append("\n".join(changes))
+        parts.append("\n\n")
 
-    script += "Check out the full release notes on GitHub!"
+    parts.append("Check out the full release notes on GitHub!")
 
-    return script.strip()
+    return ''.join(parts).strip()
 
 
-def generate_release_video(api_key, repo_owner, repo_name):
+def generate_release_video(api_key, repo_owner, repo_name, webhook_url=None, webhook_secret=None):
     """
     Complete workflow: Fetch release → Generate video → Return URL
 
+    When webhook_url is given, no polling is done: the job is created with
+    the webhook attached and returned immediately (status='queued'). The
+    final video URL is delivered to your webhook endpoint instead.
+
     Args:
         api_key (str): Your VLOEX API key
         repo_owner (str): GitHub repository owner
         repo_name (str): GitHub repository name
+        webhook_url (str): Optional webhook URL for completion notification
+        webhook_secret (str): Optional secret for webhook HMAC signature
 
     Returns:
         dict: Video metadata including URL and status
     """
     # Step 1: Initialize VLOEX SDK
-    vloex = Vloex(api_key)
+    # (status_cache_ttl=0: the polling fallback below sets its own pace, so
+    # in-progress statuses must not be served from the 2s cache)
+    vloex = Vloex(api_key, status_cache_ttl=0)
 
     # Step 2: Fetch latest release from GitHub
     release = fetch_latest_release(repo_owner, repo_name)
@@ -141,41 +223,85 @@ def generate_release_video(api_key, repo_owner, repo_name):
     print('\n🎬 Creating video with VLOEX...')
 
     try:
-        video = vloex.videos.create(script=script)
+        video = vloex.videos.create(
+            script=script,
+            webhook_url=webhook_url,
+            webhook_secret=webhook_secret
+        )
 
         print(f'✅ Video job created: {video["id"]}')
         print(f'📊 Initial status: {video["status"]}')
 
+        # Webhook mode: completion is pushed to us, so skip polling
+        if webhook_url:
+            print(f'🔔 Webhook will be called at: {webhook_url}')
+            return video
+
         # Step 5: Poll for completion
         print('\n⏳ Waiting for video generation...')
 
-        max_attempts = 60  # 5 minutes max (60 * 5 seconds)
+        # Long-poll when supported, otherwise capped exponential backoff
+        # (1s, 1.5s, 2.25s, ... up to 15s between polls)
+        delay = 1.0
+        deadline = time.monotonic() + 300  # 5 minutes max
         attempt = 0
-
-        while attempt < max_attempts:
-            time.sleep(5)
-            status = vloex.videos.retrieve(video['id'])
+        status = video
+        job_id = video['id']
+        last_state = video['status']
+        retrieve = vloex.videos.retrieve
+        retrieve_blocking = vloex.videos.retrieve_blocking
+        use_long_poll = True
+        stdout_write = sys.stdout.write
+
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+
+            # Prefer one held long-poll request; fall back to plain polling on 501
+            if use_long_poll:
+                try:
+                    status = retrieve_blocking(job_id, timeout=min(60, max(1, int(deadline - started))))
+                except VloexError as error:
+                    if error.status_code != 501:
+                        raise
+                    use_long_poll = False
+                    continue
+            else:
+                status = retrieve(job_id)
+
+            state = status['status']
             attempt += 1
 
-            # Show progress
-            print(f'   Attempt {attempt}/{max_attempts} - Status: {status["status"]}', end='\r')
+            # Show progress on state changes and every 3rd attempt
+            if state != last_state or attempt % 3 == 0:
+                stdout_write(f'   Attempt {attempt} - Status: {state}\r')
+                sys.stdout.flush()
+                last_state = state
 
-            if status['status'] == 'completed':
+            if state == 'completed':
                 print('\n\n🎉 Video generation complete!')
                 print(f'🎥 Video URL: {status["url"]}')
                 print(f'\n📊 Full Response:')
-                print(json.dumps(status, indent=2))
+                if orjson:
+                    print(orjson.dumps(status, option=orjson.OPT_INDENT_2).decode('utf-8'))
+                else:
+                    print(json.dumps(status, indent=2))
                 return status
 
-            if status['status'] == 'failed':
+            if state == 'failed':
                 print('\n\n❌ Video generation failed')
                 print(f'Error: {status.get("error", "Unknown error")}')
                 return status
 
+            # Servers without long-poll answer immediately; keep the backoff pace
+            elapsed = time.monotonic() - started
+            if elapsed < delay:
+                time.sleep(delay - elapsed)
+            delay = min(delay * 1.5, 15.0)
+
         # Timeout
         print('\n\n⏰ Timeout: Video generation took longer than expected')
         print('   Check the video status later using:')
-        print(f'   vloex.videos.retrieve("{video["id"]}")')
+        print(f'   vloex.videos.retrieve("{job_id}")')
         return status
 
     except VloexError as error:
@@ -185,9 +311,91 @@ def generate_release_video(api_key, repo_owner, repo_name):
         raise
 
 
+# ----------------------------------------------------------------------------
+# Concurrent mode: fetch + create for many repos at once
+# ----------------------------------------------------------------------------
+
+REPOS = [
+    ('facebook', 'react'),
+    ('microsoft', 'vscode'),
+    ('vuejs', 'vue'),
+    ('angular', 'angular'),
+]
+
+
+async def fetch_latest_release_async(client, repo_owner, repo_name):
+    """
+    Async version of fetch_latest_release using a shared httpx.AsyncClient.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client
+        repo_owner (str): GitHub repository owner
+        repo_name (str): GitHub repository name
+
+    Returns:
+        dict: Release data from GitHub API
+    """
+    memo_key = (repo_owner, repo_name)
+    memo = _release_memo.get(memo_key)
+    if memo and time.monotonic() - memo[0] < RELEASE_TTL_SECONDS:
+        return memo[1]
+
+    url = f'https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest'
+    response = await client.get(url, headers={'Accept': 'application/vnd.github+json'})
+
+    if response.status_code != 200:
+        raise Exception(f'GitHub API error ({repo_owner}/{repo_name}): {response.status_code}')
+
+    release = response.json()
+    _release_memo[memo_key] = (time.monotonic(), release)
+    return release
+
+
+async def generate_release_video_async(client, vloex, repo_owner, repo_name, webhook_url=None, webhook_secret=None):
+    """
+    Fetch a release and create its video job without blocking other repos.
+
+    Returns the queued job; use webhooks (or vloex.videos.retrieve) for completion.
+    """
+    release = await fetch_latest_release_async(client, repo_owner, repo_name)
+
+    changes = extract_release_highlights(release['body'] or '')
+    script = create_release_script(release['tag_name'], changes, repo_name)
+
+    return await vloex.videos.create(
+        script=script,
+        webhook_url=webhook_url,
+        webhook_secret=webhook_secret
+    )
+
+
+async def generate_release_videos_async(api_key, repos=REPOS, webhook_url=None, webhook_secret=None):
+    """
+    Create release videos for several repositories concurrently.
+
+    GitHub and VLOEX calls overlap, so wall-clock time approaches the slowest
+    repo rather than the sum. HTTP/2 multiplexes GitHub calls on one connection.
+
+    Returns:
+        list: Job dict (or exception) per repo, in input order
+    """
+    import httpx
+
+    async with AsyncVloex(api_key) as vloex, httpx.AsyncClient(http2=True, timeout=30) as client:
+        return await asyncio.gather(
+            *[
+                generate_release_video_async(client, vloex, owner, name, webhook_url, webhook_secret)
+                for owner, name in repos
+            ],
+            return_exceptions=True
+        )
+
+
 def main():
     """
     Example usage with different repositories
+
+    Pass --all to create videos for every repo in REPOS concurrently.
     """
     # Get API key from environment variable (recommended for security)
     api_key = os.environ.get('VLOEX_API_KEY')
@@ -201,6 +409,16 @@ def main():
     print('🚀 GitHub Release Video Generator')
     print('=' * 60)
 
+    if '--all' in sys.argv[1:]:
+        print(f'\n📦 Creating videos for {len(REPOS)} repositories concurrently...\n')
+        results = asyncio.run(generate_release_videos_async(api_key))
+        for (owner, name), result in zip(REPOS, results):
+            if isinstance(result, Exception):
+                print(f'   ❌ {owner}/{name}: {result}')
+            else:
+                print(f'   ✅ {owner}/{name}: job {result["id"]} ({result["status"]})')
+        return
+
     # Example 1: Next.js Release
     print('\n📦 Example: Next.js Latest Release\n')
     try:
@@ -224,6 +442,7 @@ def main():
     print('   - microsoft/vscode')
     print('   - vuejs/vue')
     print('   - angular/angular')
+    print('   Or run with --all to generate them all concurrently')
     print('\n📚 Documentation: https://docs.vloex.com')
 
 
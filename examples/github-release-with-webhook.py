@@ -21,19 +21,35 @@ Use Cases:
 
 Requirements:
 -------------
-pip install vloex requests flask
+pip install vloex requests flask waitress
 
 Get your API key from: https://vloex.com/dashboard/api-keys
 """
 
 import os
+from functools import lru_cache
 import requests
-from vloex import Vloex, VloexError
+from vloex import Vloex, VloexError, verify_webhook
 
 # ============================================================================
 # Part 1: Video Generation with Webhook
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def build_release_script(name, version, body):
+    """Format the announcement script (cached so webhook retries reuse it)."""
+    return f"""
+    Hey everyone! {name} is here!
+
+    We're excited to announce {version} with some amazing updates.
+
+    {body[:500]}...
+
+    Check out the full release notes on GitHub to learn more.
+    Update now to get these improvements!
+    """
+
+
 def generate_release_video_with_webhook(api_key, repo_owner, repo_name, webhook_url, webhook_secret=None):
     """
     Generate a video from GitHub release with webhook notification.
@@ -60,16 +76,7 @@ def generate_release_video_with_webhook(api_key, repo_owner, repo_name, webhook_
     body = release.get('body', 'No release notes available.')
 
     # Format script for video
-    script = f"""
-    Hey everyone! {name} is here!
-
-    We're excited to announce {version} with some amazing updates.
-
-    {body[:500]}...
-
-    Check out the full release notes on GitHub to learn more.
-    Update now to get these improvements!
-    """
+    script = build_release_script(name, version, body)
 
     # Initialize VLOEX client
     vloex = Vloex(api_key)
@@ -92,40 +99,33 @@ def generate_release_video_with_webhook(api_key, repo_owner, repo_name, webhook_
 # Part 2: Webhook Receiver (Flask Example)
 # ============================================================================
 
-from flask import Flask, request, jsonify
-import hmac
-import hashlib
-import time
+from flask import Flask, Response, request
+import json
+import queue
+import threading
 
-app = Flask(__name__)
+try:
+    import orjson  # Optional: faster JSON parsing (pip install orjson)
+except ImportError:
+    orjson = None
 
-# Store your webhook secret (same as used in generate_video call)
-WEBHOOK_SECRET = os.getenv('VLOEX_WEBHOOK_SECRET', 'my_secret_key_123')
 
+def dump_json(obj):
+    """Serialize to JSON bytes (orjson when available, bypassing Flask's jsonify)."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode('utf-8')
 
-def verify_webhook_signature(payload_json, signature, timestamp, secret):
-    """
-    Verify HMAC signature from VLOEX webhook.
 
-    This prevents unauthorized webhook calls and replay attacks.
-    """
-    # Check timestamp is not too old (prevent replay attacks)
-    if abs(time.time() - int(timestamp)) > 300:  # 5 minutes tolerance
-        return False
+def json_response(body, status):
+    return Response(body, status=status, mimetype='application/json')
+
 
-    # Reconstruct the signed message
-    message = f"{timestamp}.{payload_json}"
+# Pre-serialized bodies for the hot path
+_QUEUED_BODY = dump_json({"status": "queued"})
 
-    # Calculate expected signature
-    expected_signature = hmac.new(
-        secret.encode('utf-8'),
-        message.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+app = Flask(__name__)
 
-    # Compare signatures (constant-time comparison prevents timing attacks)
-    provided_signature = signature.split('=')[1] if '=' in signature else signature
-    return hmac.compare_digest(expected_signature, provided_signature)
+# Store your webhook secret (same as used in generate_video call)
+WEBHOOK_SECRET = os.getenv('VLOEX_WEBHOOK_SECRET', 'my_secret_key_123')
 
 
 @app.route('/api/vloex-webhook', methods=['POST'])
@@ -139,18 +139,38 @@ def handle_vloex_webhook():
     signature = request.headers.get('X-VLOEX-Signature', '')
     timestamp = request.headers.get('X-VLOEX-Timestamp', '')
 
-    # Get raw payload for signature verification
-    payload_json = request.get_data(as_text=True)
+    # Get raw payload bytes for signature verification and parsing
+    payload_bytes = request.get_data()
 
-    # Verify signature (if secret was provided)
+    # Verify signature (if secret was provided); the SDK helper checks the
+    # HMAC in constant time and rejects stale or malformed timestamps (replays)
     if WEBHOOK_SECRET and signature:
-        if not verify_webhook_signature(payload_json, signature, timestamp, WEBHOOK_SECRET):
+        if not verify_webhook(payload_bytes, signature, timestamp, WEBHOOK_SECRET):
             print("❌ Invalid webhook signature!")
-            return jsonify({"error": "Invalid signature"}), 401
+            return json_response(dump_json({"error": "Invalid signature"}), 401)
+
+    # Parse payload (both orjson's and json's decode errors are ValueErrors)
+    try:
+        payload = orjson.loads(payload_bytes) if orjson else json.loads(payload_bytes)
+    except ValueError:
+        return json_response(dump_json({"error": "Invalid JSON"}), 400)
+
+    # Hand off to the background worker and acknowledge right away
+    try:
+        _WORK_Q.put_nowait(payload)
+    except queue.Full:
+        # Non-2xx makes VLOEX retry the delivery later
+        return json_response(dump_json({"error": "Busy, retry later"}), 503)
+
+    # Return 200 quickly to acknowledge receipt
+    # (Prevents VLOEX from retrying)
+    return json_response(_QUEUED_BODY, 200)
 
-    # Parse payload
-    payload = request.get_json()
 
+def process_webhook_event(payload):
+    """
+    Process a verified webhook payload (runs on the background worker).
+    """
     # Handle different webhook events
     event = payload.get('event')
     job_id = payload.get('job_id')
@@ -176,9 +196,24 @@ def handle_vloex_webhook():
         # - Send error notification
         # - Log to error tracking
 
-    # Always return 200 to acknowledge receipt
-    # (Prevents VLOEX from retrying)
-    return jsonify({"status": "received"}), 200
+
+# In-memory work queue drained by a daemon thread.
+# Swap for Redis/RQ/Celery if events must survive restarts.
+_WORK_Q = queue.Queue(maxsize=1024)
+
+
+def _drain():
+    while True:
+        payload = _WORK_Q.get()
+        try:
+            process_webhook_event(payload)
+        except Exception as e:
+            print(f"❌ Webhook processing failed: {e}")
+        finally:
+            _WORK_Q.task_done()
+
+
+threading.Thread(target=_drain, daemon=True).start()
 
 
 # ============================================================================
@@ -351,4 +386,14 @@ if __name__ == '__main__':
     print("2. Run: python github-release-with-webhook.py")
     print("3. Use ngrok URL as webhook_url\n")
 
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Serve with a multi-threaded WSGI server so deliveries aren't serialized.
+    # For production, copy this receiver into an importable module
+    # (e.g. webhook_receiver.py) and run it under gunicorn instead:
+    #   gunicorn -w 2 -k gthread --threads 8 webhook_receiver:app
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠️  waitress not installed - falling back to Flask dev server")
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -3,10 +3,22 @@ VLOEX SDK Example: Journey Mode 1 - Provide Screenshots
 Use this when you already have screenshots or custom automation
 """
 import asyncio
-import base64
+import mmap
 from pathlib import Path
 from vloex import Vloex
 
+try:
+    from pybase64 import b64encode  # Optional: SIMD-accelerated (pip install pybase64)
+except ImportError:
+    from base64 import b64encode
+
+
+def encode_screenshot(path):
+    """Base64-encode an image file straight from a memory map (no extra copy)."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return b64encode(mm).decode('ascii')
+
+
 async def main():
     # Initialize VLOEX SDK
     vloex = Vloex('vs_live_...')  # Replace with your API key
@@ -16,8 +28,8 @@ async def main():
     screenshot2_path = Path('screenshot2.png')
 
     # Convert to base64
-    screenshot1_b64 = base64.b64encode(screenshot1_path.read_bytes()).decode('utf-8')
-    screenshot2_b64 = base64.b64encode(screenshot2_path.read_bytes()).decode('utf-8')
+    screenshot1_b64 = encode_screenshot(screenshot1_path)
+    screenshot2_b64 = encode_screenshot(screenshot2_path)
 
     # Generate video from screenshots
     result = vloex.videos.from_journey(
@@ -4,26 +4,38 @@ Use this when you already have screenshots and know what each one shows
 (Fastest method - no Vision AI needed!)
 """
 from vloex import Vloex
-import base64
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+
+try:
+    from pybase64 import b64encode  # Optional: SIMD-accelerated (pip install pybase64)
+except ImportError:
+    from base64 import b64encode
+
+
+def encode_screenshot(path):
+    """Base64-encode an image file straight from a memory map (no extra copy)."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return b64encode(mm).decode('ascii')
+
 
 def main():
     # Initialize VLOEX SDK
     vloex = Vloex('vs_live_...')  # Replace with your API key
 
     # Load your screenshots (from Figma, design tools, or manual captures)
-    screenshot1_path = "path/to/login.png"
-    screenshot2_path = "path/to/dashboard.png"
-
-    # Read and encode screenshots
-    with open(screenshot1_path, 'rb') as f:
-        screenshot1_b64 = base64.b64encode(f.read()).decode('utf-8')
+    screenshot_paths = [
+        "path/to/login.png",
+        "path/to/dashboard.png",
+    ]
 
-    with open(screenshot2_path, 'rb') as f:
-        screenshot2_b64 = base64.b64encode(f.read()).decode('utf-8')
+    # Read and encode screenshots in parallel (overlaps disk I/O with encoding)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        screenshots_b64 = list(ex.map(encode_screenshot, screenshot_paths))
 
     # Generate video with YOUR descriptions (fast and cheap!)
     result = vloex.videos.from_journey(
-        screenshots=[screenshot1_b64, screenshot2_b64],
+        screenshots=screenshots_b64,
         descriptions=[
             "Welcome to the login page. Enter your credentials to access the dashboard.",
             "The main dashboard shows all your metrics and recent activity at a glance."
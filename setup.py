@@ -33,5 +33,10 @@ setup(
     install_requires=[
         "requests>=2.25.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6"],
+        "http2": ["httpx[http2]>=0.23"],
+        "async": ["httpx[http2]>=0.23"],
+    },
     keywords="vloex video generation api ai avatar",
 )
@@ -10,7 +10,16 @@ Usage:
 
 __version__ = '0.1.0'
 
-from .client import Vloex
+from .client import Vloex, VideoResource
 from .exceptions import VloexError
+from .webhooks import verify_webhook
 
-__all__ = ['Vloex', 'VloexError']
+__all__ = ['Vloex', 'AsyncVloex', 'VideoResource', 'VloexError', 'verify_webhook']
+
+
+def __getattr__(name):
+    # AsyncVloex pulls in asyncio; only import it when asked for
+    if name == 'AsyncVloex':
+        from .async_client import AsyncVloex
+        return AsyncVloex
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
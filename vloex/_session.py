@@ -0,0 +1,53 @@
+"""
+VLOEX SDK HTTP session
+Imported on first request so `import vloex` stays cheap
+"""
+
+import random
+from typing import Dict, Union
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .client import _POOL_MAXSIZE, _RETRY_AFTER_MAX, _RETRY_BACKOFF, _RETRY_STATUSES
+
+
+class _Retry(Retry):
+    """urllib3 Retry that caps server-requested waits and adds jitter"""
+
+    RETRY_AFTER_MAX = _RETRY_AFTER_MAX
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX) * random.uniform(1.0, 1.1)
+
+    def get_backoff_time(self):
+        return super().get_backoff_time() * random.uniform(0.8, 1.2)
+
+
+def build_session(headers: Dict[str, str], max_retries: Union[int, Retry] = 3) -> requests.Session:
+    """
+    Build a pooled keep-alive session: one TCP/TLS handshake shared across calls.
+
+    Retries reuse pooled connections; Retry-After is honored (capped at 15s).
+    POSTs are retried too - Vloex._do always sends an Idempotency-Key with them.
+    """
+    if isinstance(max_retries, Retry):
+        retry = max_retries
+    else:
+        retry = _Retry(
+            total=max_retries,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    return session
@@ -0,0 +1,233 @@
+"""
+VLOEX SDK Async Client
+Same API as Vloex, backed by httpx.AsyncClient (pip install vloex[async])
+"""
+
+import asyncio
+import os
+import random
+import time
+from typing import BinaryIO, Dict, Optional, List, Union
+from .client import (
+    DEFAULT_BASE_URL, TERMINAL_STATUSES, _JourneyBody, _create_payload, _journey_payload, _prepare_request,
+    _handle_response, _retry_delay, _tx_generate, _tx_status, _tx_from_journey
+)
+
+
+class _AsyncBody:
+    """
+    Async view of a streaming request body (_JourneyBody, _GzipBody) for httpx.
+
+    Each chunk is produced in a worker thread, so reading and base64-encoding
+    screenshots never blocks the event loop. Re-iterable, so retries can resend it.
+    """
+
+    __slots__ = ('_body',)
+
+    def __init__(self, body):
+        self._body = body
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        chunks = iter(self._body)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+class AsyncVideoResource:
+    """Videos resource - async variant of VideoResource"""
+
+    __slots__ = ('_client',)
+
+    def __init__(self, client: 'AsyncVloex'):
+        self._client = client
+
+    async def create(self, script: str, webhook_url: str = None, webhook_secret: str = None, idempotency_key: str = None, **options) -> Dict:
+        """
+        Create a video from text (returns immediately). See VideoResource.create.
+
+        Example:
+            video = await vloex.videos.create(script='Version 2.0 is live!')
+        """
+        payload = _create_payload(script, webhook_url, webhook_secret, options)
+        return await self._client._request('POST', '/v1/generate', payload, idempotency_key=idempotency_key, tx=_tx_generate)
+
+    async def retrieve(self, id: str) -> Dict:
+        """
+        Get video status and URL. See VideoResource.retrieve.
+
+        Example:
+            status = await vloex.videos.retrieve('job_abc123')
+        """
+        return await self._client._request('GET', f'/v1/jobs/{id}/status', tx=_tx_status)
+
+    async def retrieve_blocking(self, id: str, timeout: int = 60) -> Dict:
+        """
+        Long-poll video status. See VideoResource.retrieve_blocking.
+        """
+        return await self._client._request('GET', f'/v1/jobs/{id}/status?wait={int(timeout)}', timeout=timeout + 10, tx=_tx_status)
+
+    async def wait(self, id: str, timeout: float = 900, initial_delay: float = 1.0, max_delay: float = 15.0, factor: float = 2.0) -> Dict:
+        """
+        Poll until a video finishes, with capped exponential backoff. See VideoResource.wait.
+
+        Example:
+            status = await vloex.videos.wait(video['id'])
+        """
+        delay = initial_delay
+        deadline = time.monotonic() + timeout
+
+        while True:
+            result = await self.retrieve(id)
+            remaining = deadline - time.monotonic()
+            if result.get('status') in TERMINAL_STATUSES or remaining <= 0:
+                return result
+
+            await asyncio.sleep(min(delay * random.uniform(0.8, 1.2), remaining))
+            delay = min(delay * factor, max_delay)
+
+    async def retrieve_many(self, ids: List[str]) -> List[Dict]:
+        """
+        Get the status of several videos concurrently
+
+        Requests are multiplexed over the client's pooled (HTTP/2) connection.
+
+        Args:
+            ids: Video job IDs
+
+        Returns:
+            list: Video objects, in the same order as ids
+
+        Example:
+            statuses = await vloex.videos.retrieve_many(['job_a', 'job_b'])
+        """
+        return list(await asyncio.gather(*(self.retrieve(i) for i in ids)))
+
+    async def from_journey(
+        self,
+        screenshots: Optional[List[Union[str, os.PathLike, BinaryIO]]] = None,
+        descriptions: Optional[List[str]] = None,
+        product_url: Optional[str] = None,
+        pages: Optional[List[str]] = None,
+        product_context: str = None,
+        step_duration: int = 15,
+        avatar_position: str = 'bottom-right',
+        tone: str = 'professional',
+        webhook_url: str = None,
+        webhook_secret: str = None,
+        **options
+    ) -> Dict:
+        """
+        Create product demo videos from screenshots or URLs (returns immediately).
+        See VideoResource.from_journey for modes and arguments.
+
+        Example:
+            video = await vloex.videos.from_journey(
+                product_url='https://myapp.com',
+                pages=['/', '/pricing'],
+                product_context='MyApp Website Tour'
+            )
+        """
+        payload = _journey_payload(
+            screenshots, descriptions, product_url, pages, product_context,
+            step_duration, avatar_position, tone, webhook_url, webhook_secret, options
+        )
+        # Stream screenshots like the sync client; building the body may read
+        # non-seekable files, so that happens off the event loop too
+        content = None
+        if 'screenshots' in payload:
+            content = await asyncio.get_running_loop().run_in_executor(None, _JourneyBody, payload)
+        return await self._client._request('POST', '/v1/videos/from-journey', payload, content=content, tx=_tx_from_journey)
+
+
+class AsyncVloex:
+    """VLOEX SDK Async Client"""
+
+    __slots__ = ('api_key', 'base_url', 'videos', '_url_prefix', '_client', '_compress', '_retries')
+
+    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL, compress: bool = True, max_retries: int = 3):
+        """
+        Initialize VLOEX async SDK
+
+        Args:
+            api_key: Your VLOEX API key (get one at https://vloex.com/api-keys)
+            base_url: Optional custom base URL
+            compress: Gzip request bodies larger than 16 KB (default: True)
+            max_retries: Retries for connection errors, 408/425/429 and 5xx responses with
+                         exponential backoff + jitter (default: 3, 0 disables)
+
+        Example:
+            async with AsyncVloex('vs_live_...') as vloex:
+                video = await vloex.videos.create(script='Hello world')
+        """
+        if not api_key:
+            raise ValueError('VLOEX API key required. Get one at https://vloex.com/api-keys')
+
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError('AsyncVloex requires httpx. Install it with: pip install vloex[async]') from None
+
+        self.api_key = api_key
+        self.base_url = base_url
+        self._url_prefix = base_url.rstrip('/')
+        self._compress = compress
+        self._retries = max_retries
+        self.videos = AsyncVideoResource(self)
+
+        # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        self._client = httpx.AsyncClient(
+            timeout=60,
+            transport=httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=max_retries),
+            headers={
+                'Authorization': f'Bearer {api_key}'.encode('latin-1'),
+                'Content-Type': 'application/json',
+                'Accept-Encoding': 'gzip, deflate',
+            }
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The client can't be used afterwards."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncVloex':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, body: Optional[Dict] = None, idempotency_key: str = None, timeout: float = 60, content=None, *, tx=None) -> Dict:
+        """Internal: Make HTTP request (content: pre-encoded or streaming body, overrides body)"""
+        headers, content = _prepare_request(method, body, content, idempotency_key, self._retries, self._compress)
+        if content is not None and not isinstance(content, bytes):
+            content = _AsyncBody(content)
+
+        # httpx's transport only retries failed connects; retry responses here
+        attempt = 0
+        while True:
+            response = await self._client.request(
+                method=method,
+                url=self._url_prefix + path,
+                headers=headers,
+                content=content,
+                timeout=timeout
+            )
+            delay = _retry_delay(response, attempt, self._retries)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        return _handle_response(
+            tx, response.status_code, response.content, response.reason_phrase, response.headers.get('Content-Type')
+        )
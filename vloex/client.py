@@ -3,17 +3,338 @@ VLOEX SDK Client
 Minimal, Stripe-style API
 """
 
-from typing import Dict, Optional, List
-import requests
+import base64
+import functools
+import gzip
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, Optional, List, Union
 from .exceptions import VloexError
+from .webhooks import verify_webhook
+
+if TYPE_CHECKING:
+    from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install vloex[fast]
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # secondary fallback when orjson isn't available
+    ujson = None
 
 
 DEFAULT_BASE_URL = 'https://api.vloex.com'
 
+# Job states after which a video's status no longer changes
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'error'})
+
+# Accepted from_journey options, checked locally to fail before a round trip
+_AVATAR_POSITIONS = frozenset({'bottom-right', 'bottom-left', 'top-right', 'top-left'})
+_TONES = frozenset({'professional', 'casual', 'technical'})
+
+# Responses worth retrying, with backoff shared by the requests (urllib3) and httpx transports
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+_RETRY_BACKOFF = 0.5
+_RETRY_AFTER_MAX = 15
+
+# Keep-alive connections per host in the requests transport; retrieve_many's
+# thread count is capped to this so no connection is opened and then discarded
+_POOL_MAXSIZE = 20
+
+
+def _retry_delay(response, attempt: int, retries: int) -> Optional[float]:
+    """
+    Seconds to sleep before retrying an httpx response (attempt is 0-based),
+    or None if it shouldn't be retried. Retry-After wins, capped.
+    """
+    if response.status_code not in _RETRY_STATUSES or attempt >= retries:
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = None  # HTTP-date form; fall back to exponential backoff
+        if seconds is not None and math.isfinite(seconds):
+            return max(0.0, min(seconds, _RETRY_AFTER_MAX)) * random.uniform(1.0, 1.1)
+    return _RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.8, 1.2)
+
+
+def _json_loads(content: bytes):
+    """Decode a JSON response body, using orjson/ujson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    if ujson is not None:
+        return ujson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode a request body as compact UTF-8 JSON, using orjson/ujson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Request bodies below this size are sent uncompressed; gzip's CPU and header
+# overhead outweighs the bytes saved on small JSON
+_GZIP_MIN_SIZE = 16 * 1024
+_GZIP_LEVEL = 4
+
+
+# Raw bytes per base64 chunk; a multiple of 3 so chunks encode without padding
+_B64_CHUNK = 3 * 16384
+
+
+def _iter_b64(f) -> Iterator[bytes]:
+    """Base64-encode a binary file object chunk by chunk"""
+    carry = b''
+    while True:
+        chunk = f.read(_B64_CHUNK)
+        if not chunk:
+            break
+        chunk = carry + chunk
+        cut = len(chunk) - len(chunk) % 3
+        carry = chunk[cut:]
+        if cut:
+            yield base64.b64encode(chunk[:cut])
+    if carry:
+        yield base64.b64encode(carry)
+
+
+class _JourneyBody:
+    """
+    Streaming JSON body for from_journey: screenshots are encoded one at a
+    time, so peak memory is one screenshot instead of the whole request.
+
+    Re-iterable, so urllib3 can resend it on retry: seekable file objects are
+    rewound, and non-seekable ones (pipes, sockets) are read into memory up front.
+    """
+
+    __slots__ = ('_screenshots', '_head', '_starts', '_large')
+
+    def __init__(self, payload: Dict):
+        self._screenshots = [
+            shot.read() if hasattr(shot, 'read') and not shot.seekable() else shot
+            for shot in payload['screenshots']
+        ]
+        rest = {k: v for k, v in payload.items() if k != 'screenshots'}
+        self._head = _json_dumps(rest)[:-1] + (b',' if rest else b'') + b'"screenshots":['
+        self._starts = {
+            i: shot.tell() for i, shot in enumerate(self._screenshots)
+            if hasattr(shot, 'read')
+        }
+        # Worth gzipping if it reads images from disk/files or its inline strings are big
+        self._large = any(not isinstance(shot, str) for shot in self._screenshots) or (
+            len(self._head) + sum(map(len, self._screenshots)) >= _GZIP_MIN_SIZE
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        for i, shot in enumerate(self._screenshots):
+            if i:
+                yield b','
+            if isinstance(shot, str):
+                yield _json_dumps(shot)
+            elif isinstance(shot, os.PathLike):
+                yield b'"'
+                with open(shot, 'rb') as f:
+                    yield from _iter_b64(f)
+                yield b'"'
+            elif isinstance(shot, bytes):
+                yield b'"' + base64.b64encode(shot) + b'"'
+            else:
+                shot.seek(self._starts[i])
+                yield b'"'
+                yield from _iter_b64(shot)
+                yield b'"'
+        yield b']}'
+
+
+class _GzipBody:
+    """Gzip-compresses a streaming body on the fly, staying re-iterable for retries"""
+
+    __slots__ = ('_body',)
+
+    def __init__(self, body):
+        self._body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        z = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31: gzip container
+        for chunk in self._body:
+            out = z.compress(chunk)
+            if out:
+                yield out
+        yield z.flush()
+
+
+def _compress_body(data):
+    """Gzip a request body when it's worth it; returns (data, compressed)"""
+    if data is None:
+        return data, False
+    if isinstance(data, bytes):
+        if len(data) < _GZIP_MIN_SIZE:
+            return data, False
+        return gzip.compress(data, compresslevel=_GZIP_LEVEL), True
+    # Streaming bodies are from_journey screenshots; size is estimated up front
+    if not data._large:
+        return data, False
+    return _GzipBody(data), True
+
+
+def _prepare_request(method: str, body: Optional[Dict], content, idempotency_key: Optional[str], retries: int, compress: bool):
+    """Build per-call headers and the encoded request body; returns (headers, content)"""
+    # Auth and content-type headers live on the transport; only per-call extras here.
+    # Retried POSTs must not create duplicate jobs, so they always carry a key.
+    if not idempotency_key and method == 'POST' and retries:
+        idempotency_key = str(uuid.uuid4())
+
+    headers = None
+    if idempotency_key:
+        headers = {'Idempotency-Key': idempotency_key}
+
+    # Pre-serialized compact JSON (smaller than requests' default encoding)
+    if content is None and body is not None:
+        content = _json_dumps(body)
+
+    if compress:
+        content, compressed = _compress_body(content)
+        if compressed:
+            headers = headers or {}
+            headers['Content-Encoding'] = 'gzip'
+
+    return headers, content
+
+
+def _create_payload(script: str, webhook_url: Optional[str], webhook_secret: Optional[str], options: Dict) -> Dict:
+    """Build the /v1/generate request body"""
+    payload = {
+        'input': script,
+        'options': options
+    }
+
+    if webhook_url:
+        payload['webhook_url'] = webhook_url
+
+    if webhook_secret:
+        payload['webhook_secret'] = webhook_secret
+
+    return payload
+
+
+def _journey_payload(screenshots, descriptions, product_url, pages, product_context,
+                     step_duration, avatar_position, tone, webhook_url, webhook_secret, options) -> Dict:
+    """Validate arguments and build the /v1/videos/from-journey request body"""
+    # Validate before allocating anything
+    if not product_context:
+        raise ValueError('product_context is required')
+    if avatar_position not in _AVATAR_POSITIONS:
+        raise ValueError(f"avatar_position must be one of: {', '.join(sorted(_AVATAR_POSITIONS))}")
+    if tone not in _TONES:
+        raise ValueError(f"tone must be one of: {', '.join(sorted(_TONES))}")
+
+    payload = {
+        'product_context': product_context,
+        'step_duration': step_duration,
+        'avatar_position': avatar_position,
+        'tone': tone,
+    }
+    if options:
+        payload.update(options)
+
+    # Level 1: Screenshots + descriptions
+    # (materialized so a generator isn't exhausted before the body is streamed)
+    if screenshots is not None:
+        screenshots = list(screenshots)
+    if screenshots:
+        payload['screenshots'] = screenshots
+        if descriptions:
+            payload['descriptions'] = descriptions
+
+    # Level 2: URL + pages
+    if product_url:
+        payload['product_url'] = product_url
+        if pages:
+            payload['pages'] = pages
+
+    # Webhook support
+    if webhook_url:
+        payload['webhook_url'] = webhook_url
+    if webhook_secret:
+        payload['webhook_secret'] = webhook_secret
+
+    return payload
+
+
+def _tx_generate(data: Dict) -> Dict:
+    return {
+        'id': data.get('job_id') or data.get('id'),
+        'status': data.get('status'),
+        'url': data.get('url'),
+        'error': data.get('error')
+    }
+
+
+def _tx_status(data: Dict) -> Dict:
+    return {
+        'id': data.get('id'),
+        'status': data.get('status'),
+        'url': data.get('video_url') or data.get('url'),
+        'error': data.get('error_message') or data.get('error')
+    }
+
+
+def _tx_from_journey(data: Dict) -> Dict:
+    # Now returns job status (async endpoint)
+    return {
+        'id': data.get('id'),
+        'status': data.get('status'),
+        'created_at': data.get('created_at'),
+        'updated_at': data.get('updated_at')
+    }
+
+
+def _decode_response(status_code: int, content: bytes, reason: Optional[str] = None, content_type: Optional[str] = None) -> Dict:
+    """Decode a response body, raising VloexError on failure"""
+    # Skip the parser for empty bodies (e.g. 204) and bodies that declare a
+    # non-JSON type (e.g. an HTML error page from a proxy)
+    data = {}
+    if content and status_code != 204 and (not content_type or 'json' in content_type):
+        try:
+            data = _json_loads(content)
+        except ValueError:
+            data = {}
+
+    if status_code >= 400:
+        error_message = data.get('detail') or data.get('message') if isinstance(data, dict) else None
+        raise VloexError(error_message or reason or 'API request failed', status_code)
+
+    return data
+
+
+def _handle_response(tx, status_code: int, content: bytes, reason: Optional[str] = None, content_type: Optional[str] = None) -> Dict:
+    """Decode a response body, raise VloexError on failure, else transform it with tx"""
+    data = _decode_response(status_code, content, reason, content_type)
+    return tx(data) if tx else data
+
 
 class VideoResource:
     """Videos resource - core primitive"""
 
+    __slots__ = ('_client',)
+
     def __init__(self, client: 'Vloex'):
         self._client = client
 
@@ -39,18 +360,8 @@ class VideoResource:
                 idempotency_key=str(uuid.uuid4())  # Optional: prevents duplicate charges
             )
         """
-        payload = {
-            'input': script,
-            'options': options
-        }
-
-        if webhook_url:
-            payload['webhook_url'] = webhook_url
-
-        if webhook_secret:
-            payload['webhook_secret'] = webhook_secret
-
-        return self._client._request('POST', '/v1/generate', payload, idempotency_key=idempotency_key)
+        payload = _create_payload(script, webhook_url, webhook_secret, options)
+        return self._client._post_generate(payload, idempotency_key=idempotency_key)
 
     def retrieve(self, id: str) -> Dict:
         """
@@ -66,11 +377,100 @@ class VideoResource:
             status = vloex.videos.retrieve('job_abc123')
             print(status['url'])
         """
-        return self._client._request('GET', f'/v1/jobs/{id}/status')
+        cached = self._client._cached_status(id)
+        if cached is not None:
+            return cached
+
+        result = self._client._get_status(id)
+        self._client._store_status(id, result)
+        return result
+
+    def retrieve_many(self, ids: List[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Get the status of several videos concurrently
+
+        Requests run on a thread pool and share the client's pooled connections.
+
+        Args:
+            ids: Video job IDs
+            max_workers: Maximum concurrent requests (default: 8, capped at the
+                         connection pool size of 20)
+
+        Returns:
+            list: Video objects, in the same order as ids
+
+        Example:
+            statuses = vloex.videos.retrieve_many(['job_a', 'job_b'])
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        ids = list(ids)
+        if not ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, _POOL_MAXSIZE, len(ids))) as ex:
+            return list(ex.map(self.retrieve, ids))
+
+    def retrieve_blocking(self, id: str, timeout: int = 60) -> Dict:
+        """
+        Get video status, letting the server hold the request open until the
+        job changes state or `timeout` seconds pass (long-poll)
+
+        One held request replaces many short polls. Servers without long-poll
+        support answer immediately (same as retrieve) or with a 501 VloexError.
+
+        Args:
+            id: Video job ID
+            timeout: Seconds the server may wait before responding
+
+        Returns:
+            dict: Video object with current status
+
+        Example:
+            status = vloex.videos.retrieve_blocking('job_abc123', timeout=60)
+        """
+        result = self._client._get_status(id, f'?wait={int(timeout)}', timeout=timeout + 10)
+        self._client._store_status(id, result)
+        return result
+
+    def wait(self, id: str, timeout: float = 900, initial_delay: float = 1.0, max_delay: float = 15.0, factor: float = 2.0) -> Dict:
+        """
+        Poll until a video finishes, with capped exponential backoff
+
+        Args:
+            id: Video job ID
+            timeout: Maximum seconds to wait (default: 900)
+            initial_delay: Seconds before the second poll (default: 1.0)
+            max_delay: Upper bound on seconds between polls (default: 15.0)
+            factor: Backoff multiplier per poll (default: 2.0)
+
+        Returns:
+            dict: Final video object, or the latest one if timeout was reached
+                  (check status['status'])
+
+        Example:
+            status = vloex.videos.wait(video['id'])
+            if status['status'] == 'completed':
+                print(status['url'])
+        """
+        delay = initial_delay
+        deadline = time.monotonic() + timeout
+
+        while True:
+            # Bypass the status cache so polls follow the backoff schedule, not its TTL
+            result = self._client._get_status(id)
+            self._client._store_status(id, result)
+            remaining = deadline - time.monotonic()
+            if result.get('status') in TERMINAL_STATUSES or remaining <= 0:
+                return result
+
+            # Jitter keeps many waiting clients from polling in lockstep
+            time.sleep(min(delay * random.uniform(0.8, 1.2), remaining))
+            delay = min(delay * factor, max_delay)
 
     def from_journey(
         self,
-        screenshots: Optional[List[str]] = None,
+        screenshots: Optional[List[Union[str, os.PathLike, BinaryIO]]] = None,
         descriptions: Optional[List[str]] = None,
         product_url: Optional[str] = None,
         pages: Optional[List[str]] = None,
@@ -116,7 +516,9 @@ class VideoResource:
             )
 
         Args:
-            screenshots: List of base64-encoded images (Mode 1A/1B)
+            screenshots: List of base64-encoded images (Mode 1A/1B). Items may also be
+                         pathlib.Path objects or binary file objects; these are read and
+                         base64-encoded while the request streams, one screenshot at a time
             descriptions: Narration for each screenshot (Mode 1A). If omitted, AI auto-generates narrations (Mode 1B)
             product_url: Public URL to capture (Mode 2)
             pages: List of page paths like ['/dashboard', '/pricing'] (Mode 2)
@@ -146,113 +548,201 @@ class VideoResource:
                 "timestamp": "2024-01-15T10:42:00Z"
             }
         """
-        if not product_context:
-            raise ValueError('product_context is required')
-
-        payload = {
-            'product_context': product_context,
-            'step_duration': step_duration,
-            'avatar_position': avatar_position,
-            'tone': tone,
-            **options
-        }
-
-        # Level 1: Screenshots + descriptions
-        if screenshots:
-            payload['screenshots'] = screenshots
-            if descriptions:
-                payload['descriptions'] = descriptions
-
-        # Level 2: URL + pages
-        if product_url:
-            payload['product_url'] = product_url
-            if pages:
-                payload['pages'] = pages
-
-        # Webhook support
-        if webhook_url:
-            payload['webhook_url'] = webhook_url
-        if webhook_secret:
-            payload['webhook_secret'] = webhook_secret
-
-        return self._client._request('POST', '/v1/videos/from-journey', payload)
+        payload = _journey_payload(
+            screenshots, descriptions, product_url, pages, product_context,
+            step_duration, avatar_position, tone, webhook_url, webhook_secret, options
+        )
+        # Stream screenshots rather than building one large JSON blob in memory
+        content = _JourneyBody(payload) if 'screenshots' in payload else None
+        return self._client._post_journey(payload, content=content)
 
 
 class Vloex:
     """VLOEX SDK Client"""
 
-    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL):
+    __slots__ = (
+        'api_key', 'base_url', '_videos', '_url_prefix', '_headers', '_max_retries', '_retries',
+        '_requests_session', '_http', '_post_generate', '_post_journey', '_status_prefix',
+        '_status_cache', '_status_cache_ttl', '_status_cache_max', '_lock', '_compress',
+    )
+
+    verify_webhook = staticmethod(verify_webhook)
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        http2: bool = False,
+        status_cache_ttl: float = 2.0,
+        status_cache_max: int = 1024,
+        max_retries: Union[int, 'Retry'] = 3,
+        compress: bool = True
+    ):
         """
         Initialize VLOEX SDK
 
         Args:
             api_key: Your VLOEX API key (get one at https://vloex.com/api-keys)
             base_url: Optional custom base URL
+            http2: Multiplex requests over one HTTP/2 connection via httpx
+                   (pip install vloex[http2]); falls back to requests if unavailable
+            status_cache_ttl: Seconds to reuse an in-progress videos.retrieve() result
+                              (default: 2.0). Finished jobs are cached until evicted.
+            status_cache_max: Max job statuses kept in the cache (default: 1024, 0 disables)
+            max_retries: Retries for connection errors, 408/425/429 and 5xx responses with
+                         exponential backoff + jitter (default: 3, 0 disables), or a urllib3 Retry
+                         (with http2=True only its total is used)
+            compress: Gzip request bodies larger than 16 KB, e.g. from_journey
+                      screenshots (default: True)
         """
         if not api_key:
             raise ValueError('VLOEX API key required. Get one at https://vloex.com/api-keys')
 
         self.api_key = api_key
         self.base_url = base_url
-        self.videos = VideoResource(self)
-
-    def _request(self, method: str, path: str, body: Optional[Dict] = None, idempotency_key: str = None) -> Dict:
-        """Internal: Make HTTP request"""
-        url = f'{self.base_url}{path}'
-
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
+        self._url_prefix = base_url.rstrip('/')
+        self._videos = None
+        self._compress = compress
+
+        # Endpoint calls with URL and response transformer bound up front
+        self._post_generate = functools.partial(self._do, 'POST', self._url_prefix + '/v1/generate', _tx_generate)
+        self._post_journey = functools.partial(self._do, 'POST', self._url_prefix + '/v1/videos/from-journey', _tx_from_journey)
+        self._status_prefix = self._url_prefix + '/v1/jobs/'
+
+        # LRU cache of job statuses: id -> (expires_at, result)
+        self._status_cache = OrderedDict()
+        self._status_cache_ttl = status_cache_ttl
+        self._status_cache_max = status_cache_max
+        # Guards the status cache and lazy session creation
+        self._lock = threading.Lock()
+
+        # Constant per-client headers, built once and attached to the transport.
+        # Authorization is pre-encoded so http.client doesn't re-encode it per request.
+        self._headers = {
+            'Authorization': f'Bearer {api_key}'.encode('latin-1'),
             'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
         }
 
-        # Add idempotency key if provided
-        if idempotency_key:
-            headers['Idempotency-Key'] = idempotency_key
-
-        # Set timeout - all endpoints now return immediately (async)
-        timeout = 60
-
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=body,
-            timeout=timeout
-        )
-
-        try:
-            data = response.json()
-        except ValueError:
-            data = {}
-
-        if not response.ok:
-            error_message = data.get('detail') or data.get('message') or 'API request failed'
-            raise VloexError(error_message, response.status_code)
-
-        # Transform API response to SDK format
-        if '/generate' in path:
-            return {
-                'id': data.get('job_id') or data.get('id'),
-                'status': data.get('status'),
-                'url': data.get('url'),
-                'error': data.get('error')
-            }
-
-        if '/status' in path:
-            return {
-                'id': data.get('id'),
-                'status': data.get('status'),
-                'url': data.get('video_url') or data.get('url'),
-                'error': data.get('error_message') or data.get('error')
-            }
-
-        if '/from-journey' in path:
-            # Now returns job status (async endpoint)
-            return {
-                'id': data.get('id'),
-                'status': data.get('status'),
-                'created_at': data.get('created_at'),
-                'updated_at': data.get('updated_at')
-            }
+        # The requests session is created on first use (see _session), so
+        # constructing a client doesn't import requests/urllib3
+        self._requests_session = None
+        self._max_retries = max_retries
+        total = getattr(max_retries, 'total', max_retries)
+        self._retries = total if isinstance(total, int) else 0
+
+        # Optional HTTP/2 transport
+        self._http = None
+        if http2:
+            try:
+                import httpx
+                limits = httpx.Limits(max_keepalive_connections=8)
+                self._http = httpx.Client(
+                    timeout=60,
+                    transport=httpx.HTTPTransport(http2=True, limits=limits, retries=self._retries),
+                    headers=self._headers
+                )
+            except ImportError:
+                self._http = None
+
+    @property
+    def videos(self) -> VideoResource:
+        """Videos resource (created on first access)"""
+        if self._videos is None:
+            self._videos = VideoResource(self)
+        return self._videos
+
+    @property
+    def _session(self):
+        """Internal: Pooled requests.Session, created on first use"""
+        session = self._requests_session
+        if session is None:
+            with self._lock:
+                if self._requests_session is None:
+                    from ._session import build_session
+                    self._requests_session = build_session(self._headers, self._max_retries)
+                session = self._requests_session
+        return session
+
+    def clear_cache(self) -> None:
+        """Drop all cached video statuses"""
+        with self._lock:
+            self._status_cache.clear()
+
+    def _cached_status(self, id: str) -> Optional[Dict]:
+        """Internal: Cached status for a job, or None if missing/expired"""
+        with self._lock:
+            entry = self._status_cache.get(id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._status_cache[id]
+                return None
+            self._status_cache.move_to_end(id)
+            return dict(entry[1])
+
+    def _store_status(self, id: str, result: Dict) -> None:
+        """Internal: Cache a job status (finished jobs never change, so they don't expire)"""
+        if self._status_cache_max <= 0:
+            return
+        if result.get('status') in TERMINAL_STATUSES:
+            expires_at = float('inf')
+        elif self._status_cache_ttl > 0:
+            expires_at = time.monotonic() + self._status_cache_ttl
+        else:
+            return
+
+        with self._lock:
+            self._status_cache[id] = (expires_at, dict(result))
+            self._status_cache.move_to_end(id)
+            while len(self._status_cache) > self._status_cache_max:
+                self._status_cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Close pooled connections. The client can't be used afterwards."""
+        if self._requests_session is not None:
+            self._requests_session.close()
+        if self._http is not None:
+            self._http.close()
+
+    def __enter__(self) -> 'Vloex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_status(self, id: str, query: str = '', timeout: float = 60) -> Dict:
+        """Internal: GET a job's status"""
+        return self._do('GET', f'{self._status_prefix}{id}/status{query}', _tx_status, timeout=timeout)
+
+    def _do(self, method: str, url: str, tx, body: Optional[Dict] = None, idempotency_key: str = None, timeout: float = 60, content=None) -> Dict:
+        """Internal: Send a request to a full URL and transform the response with tx"""
+        headers, data = _prepare_request(method, body, content, idempotency_key, self._retries, self._compress)
+
+        if self._http is not None:
+            # httpx's transport only retries failed connects; retry responses here
+            attempt = 0
+            while True:
+                response = self._http.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    content=data,
+                    timeout=timeout
+                )
+                delay = _retry_delay(response, attempt, self._retries)
+                if delay is None:
+                    break
+                time.sleep(delay)
+                attempt += 1
+        else:
+            response = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                timeout=timeout
+            )
 
-        return data
+        reason = response.reason_phrase if self._http is not None else response.reason
+        return _handle_response(tx, response.status_code, response.content, reason, response.headers.get('Content-Type'))
@@ -4,6 +4,8 @@
 class VloexError(Exception):
     """Base exception for VLOEX SDK"""
 
+    __slots__ = ('message', 'status_code')
+
     def __init__(self, message: str, status_code: int = None):
         super().__init__(message)
         self.message = message
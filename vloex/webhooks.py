@@ -0,0 +1,72 @@
+"""
+VLOEX Webhook helpers
+"""
+
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+from typing import Optional, Union
+
+
+@lru_cache(maxsize=16)
+def _hmac_template(secret: bytes):
+    # Keyed once per secret; .copy() skips re-deriving the HMAC key pads
+    return hmac.new(secret, digestmod=hashlib.sha256)
+
+
+def verify_webhook(
+    payload: bytes,
+    signature: str,
+    timestamp: Union[str, int],
+    secret: Union[str, bytes],
+    tolerance: Optional[int] = 300
+) -> bool:
+    """
+    Verify a VLOEX webhook signature
+
+    VLOEX signs "{timestamp}.{raw body}" with HMAC-SHA256 using your webhook_secret
+    and sends it in the X-VLOEX-Signature header (hex, optionally "sha256=" prefixed),
+    with the timestamp in X-VLOEX-Timestamp.
+
+    Args:
+        payload: Raw request body bytes (don't re-serialize parsed JSON)
+        signature: Value of the X-VLOEX-Signature header
+        timestamp: Value of the X-VLOEX-Timestamp header
+        secret: The webhook_secret you passed when creating the video
+        tolerance: Max age in seconds before a delivery is rejected as a replay
+                   (default: 300, None disables the check)
+
+    Returns:
+        bool: True if the signature is valid
+
+    Example:
+        from vloex import verify_webhook
+
+        ok = verify_webhook(
+            request.get_data(),
+            request.headers['X-VLOEX-Signature'],
+            request.headers['X-VLOEX-Timestamp'],
+            'my_secret_key_123'
+        )
+    """
+    timestamp = str(timestamp)
+
+    try:
+        if tolerance is not None and abs(time.time() - int(timestamp)) > tolerance:
+            return False
+    except ValueError:
+        return False
+
+    if isinstance(secret, str):
+        secret = secret.encode('utf-8')
+
+    h = _hmac_template(secret).copy()
+    h.update(timestamp.encode('utf-8'))
+    h.update(b'.')
+    h.update(payload)
+
+    provided = signature.split('=', 1)[1] if '=' in signature else signature
+
+    # Constant-time comparison prevents timing attacks
+    return hmac.compare_digest(h.hexdigest().encode('ascii'), provided.encode('utf-8'))